@@ -9,24 +9,26 @@ with open(os.path.join(HERE, 'README.md')) as f:
     README = f.read()
 
 REQUIRES = [
-    'marshmallow==3.0.0b11',
-    'marshmallow-sqlalchemy',
-    'mccabe',
-    # http://initd.org/psycopg/docs/install.html#binary-install-from-pypi
-    'psycopg2-binary',
+    'marshmallow>=3.20,<4',
+    'marshmallow-sqlalchemy>=0.28',
+    # https://www.psycopg.org/psycopg3/docs/basic/install.html
+    'psycopg[c,binary]>=3.3.2',
     'py',
-    'SQLAlchemy',
-    'stringcase'
+    # The postgresql+psycopg dialect requires SQLAlchemy 2.0
+    'SQLAlchemy>=2.0'
 ]
 
 TEST_REQUIRES = [
     'pytest',
+    'pytest-xdist',
     'docker',
     'requests',
     'factory_boy'
 ]
 
-VERSION = versioneer.get_version()
+# versioneer shells out to git describe; allow CI to pre-compute the
+# version once and skip the subprocess on repeated setup.py invocations
+VERSION = os.environ.get('MINERVA_DB_VERSION') or versioneer.get_version()
 DESCRIPTION = 'minerva DB'
 AUTHOR = 'D.P.W. Russell'
 EMAIL = 'douglas_russell@hms.harvard.edu'
@@ -43,8 +45,9 @@ setup(
     packages=find_packages('src'),
     include_package_data=True,
     install_requires=REQUIRES,
-    setup_requires=['pytest-runner'],
-    tests_require=TEST_REQUIRES,
+    extras_require={
+        'test': TEST_REQUIRES
+    },
     classifiers=[
         'Development Status :: 1 - Planning',
         'Intended Audience :: Developers',
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.exc import NoResultFound
 from typing import Dict, List, Optional, Union
 from ..models import (User, Group, Membership, Repository, Import,
                       Fileset, Image, Key, Grant)
@@ -217,9 +218,13 @@ class Client():
             .filter(Import.uuid == import_uuid) \
             .one()
 
-        s3_keys = [Key(key, import_=import_) for key in keys]
-
-        self.session.add_all(s3_keys)
+        # Insert the keys as a single executemany instead of one INSERT
+        # per ORM instance
+        if keys:
+            self.session.execute(
+                Key.__table__.insert(),
+                [{'key': key, 'import_uuid': import_.uuid} for key in keys]
+            )
         self.session.commit()
 
     # TODO Is this used? It does not use serialized response
@@ -277,11 +282,10 @@ class Client():
             The Fileset details.
         '''
 
-        return to_jsonapi(fileset_schema.dump(
-            self.session.query(Fileset)
-            .filter(Fileset.uuid == uuid)
-            .one()
-        ))
+        fileset = self.session.get(Fileset, uuid)
+        if fileset is None:
+            raise NoResultFound()
+        return to_jsonapi(fileset_schema.dump(fileset))
 
     def get_group(self, uuid: str) -> SDict:
         '''Get details of the specified group.
@@ -293,11 +297,10 @@ class Client():
             The group details.
         '''
 
-        return to_jsonapi(group_schema.dump(
-            self.session.query(Group)
-            .filter(Group.uuid == uuid)
-            .one()
-        ))
+        group = self.session.get(Group, uuid)
+        if group is None:
+            raise NoResultFound()
+        return to_jsonapi(group_schema.dump(group))
 
     def get_image(self, uuid: str) -> SDict:
         '''Get details of the specified image.
@@ -309,11 +312,10 @@ class Client():
             The image details.
         '''
 
-        return to_jsonapi(image_schema.dump(
-            self.session.query(Image)
-            .filter(Image.uuid == uuid)
-            .one()
-        ))
+        image = self.session.get(Image, uuid)
+        if image is None:
+            raise NoResultFound()
+        return to_jsonapi(image_schema.dump(image))
 
     def get_import(self, uuid: str) -> SDict:
         '''Get details of the specified import.
@@ -325,14 +327,13 @@ class Client():
             The import details.
 
         Raises:
-            ValueError: If there is not exactly one matching import.
+            NoResultFound: If there is no matching import.
         '''
 
-        return to_jsonapi(import_schema.dump(
-            self.session.query(Import)
-            .filter(Import.uuid == uuid)
-            .one()
-        ))
+        import_ = self.session.get(Import, uuid)
+        if import_ is None:
+            raise NoResultFound()
+        return to_jsonapi(import_schema.dump(import_))
 
     def get_repository(self, uuid: str) -> SDict:
         '''Get details of the specified repository.
@@ -344,11 +345,10 @@ class Client():
             The repository details.
         '''
 
-        return to_jsonapi(repository_schema.dump(
-            self.session.query(Repository)
-            .filter(Repository.uuid == uuid)
-            .one()
-        ))
+        repository = self.session.get(Repository, uuid)
+        if repository is None:
+            raise NoResultFound()
+        return to_jsonapi(repository_schema.dump(repository))
 
     def get_user(self, uuid: str) -> SDict:
         '''Get details of the specified user.
@@ -360,14 +360,13 @@ class Client():
             The user details.
 
         Raises:
-            ValueError: If there is not exactly one matching user.
+            NoResultFound: If there is no matching user.
         '''
 
-        return to_jsonapi(user_schema.dump(
-            self.session.query(User)
-            .filter(User.uuid == uuid)
-            .one()
-        ))
+        user = self.session.get(User, uuid)
+        if user is None:
+            raise NoResultFound()
+        return to_jsonapi(user_schema.dump(user))
 
     def get_membership(self, group_uuid: str, user_uuid: str) -> SDict:
         '''Get details of the membership.
@@ -388,8 +387,8 @@ class Client():
             .filter(Membership.group_uuid == group_uuid)
             .filter(Membership.user_uuid == user_uuid)
             .options(
-                joinedload(Membership.group),
-                joinedload(Membership.user)
+                joinedload(Membership.group, innerjoin=True),
+                joinedload(Membership.user, innerjoin=True)
             )
             .one()
         )
@@ -750,8 +749,8 @@ class Client():
             .filter(Membership.group_uuid == group_uuid)
             .filter(Membership.user_uuid == user_uuid)
             .options(
-                joinedload(Membership.group),
-                joinedload(Membership.user)
+                joinedload(Membership.group, innerjoin=True),
+                joinedload(Membership.user, innerjoin=True)
             )
             .one()
         )
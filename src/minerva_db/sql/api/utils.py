@@ -1,5 +1,5 @@
-def to_jsonapi(data, included={}):
+def to_jsonapi(data, included=None):
     return {
         'data': data,
-        'included': included
+        'included': included if included is not None else {}
     }
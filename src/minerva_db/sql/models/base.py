@@ -1,7 +1,13 @@
+import re
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm.state import InstanceState
-from stringcase import snakecase
+
+_UPPERCASE_RE = re.compile(r'[A-Z]')
+
+
+def _snakecase(name):
+    return _UPPERCASE_RE.sub(lambda match: f'_{match.group(0).lower()}', name)
 
 
 @as_declarative()
@@ -9,7 +15,7 @@ class Base():
 
     @declared_attr
     def __tablename__(cls):
-        name = snakecase(cls.__name__).lstrip('_')
+        name = _snakecase(cls.__name__).lstrip('_')
         return f't_{name}'
 
     def __repr__(self):
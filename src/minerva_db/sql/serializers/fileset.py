@@ -1,14 +1,11 @@
-from marshmallow_sqlalchemy import ModelSchema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from ..models import Fileset
 
 
-class FilesetSchema(ModelSchema):
+class FilesetSchema(SQLAlchemyAutoSchema):
     class Meta:
         model = Fileset
         include_fk = True
-        exclude = tuple(prop.key
-                        for prop in Fileset.__mapper__.iterate_properties
-                        if hasattr(prop, 'direction') or prop.key == 'satype')
 
 
 fileset_schema = FilesetSchema()
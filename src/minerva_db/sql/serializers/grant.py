@@ -1,14 +1,11 @@
-from marshmallow_sqlalchemy import ModelSchema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from ..models import Grant
 
 
-class GrantSchema(ModelSchema):
+class GrantSchema(SQLAlchemyAutoSchema):
     class Meta:
         model = Grant
         include_fk = True
-        exclude = tuple(prop.key
-                        for prop in Grant.__mapper__.iterate_properties
-                        if hasattr(prop, 'direction') or prop.key == 'satype')
 
 
 grant_schema = GrantSchema()
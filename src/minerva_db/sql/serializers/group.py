@@ -1,13 +1,11 @@
-from marshmallow_sqlalchemy import ModelSchema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from ..models import Group
 
 
-class GroupSchema(ModelSchema):
+class GroupSchema(SQLAlchemyAutoSchema):
     class Meta:
         model = Group
-        exclude = tuple(prop.key
-                        for prop in Group.__mapper__.iterate_properties
-                        if hasattr(prop, 'direction') or prop.key == 'satype')
+        exclude = ('satype',)
 
 
 group_schema = GroupSchema()
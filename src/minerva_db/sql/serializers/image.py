@@ -1,14 +1,11 @@
-from marshmallow_sqlalchemy import ModelSchema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from ..models import Image
 
 
-class ImageSchema(ModelSchema):
+class ImageSchema(SQLAlchemyAutoSchema):
     class Meta:
         model = Image
         include_fk = True
-        exclude = tuple(prop.key
-                        for prop in Image.__mapper__.iterate_properties
-                        if hasattr(prop, 'direction') or prop.key == 'satype')
 
 
 image_schema = ImageSchema()
@@ -1,14 +1,11 @@
-from marshmallow_sqlalchemy import ModelSchema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from ..models import Import
 
 
-class ImportSchema(ModelSchema):
+class ImportSchema(SQLAlchemyAutoSchema):
     class Meta:
         model = Import
         include_fk = True
-        exclude = tuple(prop.key
-                        for prop in Import.__mapper__.iterate_properties
-                        if hasattr(prop, 'direction') or prop.key == 'satype')
 
 
 import_schema = ImportSchema()
@@ -1,14 +1,11 @@
-from marshmallow_sqlalchemy import ModelSchema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from ..models import Key
 
 
-class KeySchema(ModelSchema):
+class KeySchema(SQLAlchemyAutoSchema):
     class Meta:
         model = Key
         include_fk = True
-        exclude = tuple(prop.key
-                        for prop in Key.__mapper__.iterate_properties
-                        if hasattr(prop, 'direction') or prop.key == 'satype')
 
 
 key_schema = KeySchema()
@@ -1,14 +1,11 @@
-from marshmallow_sqlalchemy import ModelSchema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from ..models import Membership
 
 
-class MembershipSchema(ModelSchema):
+class MembershipSchema(SQLAlchemyAutoSchema):
     class Meta:
         model = Membership
         include_fk = True
-        exclude = tuple(prop.key
-                        for prop in Membership.__mapper__.iterate_properties
-                        if hasattr(prop, 'direction') or prop.key == 'satype')
 
 
 membership_schema = MembershipSchema()
@@ -1,13 +1,10 @@
-from marshmallow_sqlalchemy import ModelSchema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from ..models import Repository
 
 
-class RepositorySchema(ModelSchema):
+class RepositorySchema(SQLAlchemyAutoSchema):
     class Meta:
         model = Repository
-        exclude = tuple(prop.key
-                        for prop in Repository.__mapper__.iterate_properties
-                        if hasattr(prop, 'direction') or prop.key == 'satype')
 
 
 repository_schema = RepositorySchema()
@@ -1,13 +1,11 @@
-from marshmallow_sqlalchemy import ModelSchema
+from marshmallow_sqlalchemy import SQLAlchemyAutoSchema
 from ..models import User
 
 
-class UserSchema(ModelSchema):
+class UserSchema(SQLAlchemyAutoSchema):
     class Meta:
         model = User
-        exclude = tuple(prop.key
-                        for prop in User.__mapper__.iterate_properties
-                        if hasattr(prop, 'direction') or prop.key == 'satype')
+        exclude = ('satype',)
 
 
 user_schema = UserSchema()
@@ -1,7 +1,9 @@
 from contextlib import contextmanager
+from contextvars import ContextVar
 from minerva_db.sql.models import Base
+from operator import attrgetter
 from sqlalchemy import event
-from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.sql.base import Executable
 from typing import Dict, List, Type, Union
 
@@ -9,6 +11,20 @@ from typing import Dict, List, Type, Union
 # TODO Refine type of Dict
 
 
+# Serialised keys of each resource, shared by the tests instead of being
+# redeclared per test method
+USER_KEYS = ('uuid',)
+GROUP_KEYS = ('uuid', 'name')
+MEMBERSHIP_KEYS = ('user_uuid', 'group_uuid', 'membership_type')
+GRANT_KEYS = ('subject_uuid', 'repository_uuid', 'permission')
+REPOSITORY_KEYS = ('uuid', 'name', 'raw_storage')
+IMPORT_KEYS = ('uuid', 'name', 'complete', 'repository_uuid')
+FILESET_KEYS = ('uuid', 'name', 'reader', 'reader_software',
+                'reader_version', 'complete', 'import_uuid')
+IMAGE_KEYS = ('uuid', 'name', 'pyramid_levels', 'fileset_uuid')
+KEY_KEYS = ('key', 'import_uuid', 'fileset_uuid')
+
+
 def sa_obj_to_dict(obj: Type[Base],
                    keys: List[str]) -> Dict[str, Union[int, str, float]]:
     '''Convert a SQL Alchemy object into a dictionary with the given keys.
@@ -21,8 +37,47 @@ def sa_obj_to_dict(obj: Type[Base],
         A dictionary.
     '''
 
-    obj_dict = obj.as_dict()
-    return {key: obj_dict[key] for key in keys}
+    if len(keys) == 1:
+        return {keys[0]: getattr(obj, keys[0])}
+    return dict(zip(keys, attrgetter(*keys)(obj)))
+
+
+def fetch_cols(session, model: Type[Base],
+               keys: List[str],
+               **filters) -> Dict[str, Union[int, str, float]]:
+    '''Fetch the given columns of a single row as a dictionary.
+
+    Selects the columns directly so no full model instance is hydrated
+    into the identity map just to be compared and discarded.
+
+    Args:
+        session: The SQL Alchemy session.
+        model: The model to select from.
+        keys: The columns to include in the returned dictionary.
+        **filters: Column equality filters identifying the row.
+
+    Returns:
+        A dictionary.
+    '''
+
+    row = session.query(*(getattr(model, key) for key in keys)) \
+        .filter_by(**filters) \
+        .one()
+    return dict(zip(keys, row))
+
+
+# Single listener registered once at import. Statements are only recorded
+# while a statement_log context has installed a buffer, so tests avoid the
+# cost of rebuilding the event dispatcher on every listen/remove.
+_statements: ContextVar = ContextVar('statements', default=None)
+
+
+@event.listens_for(Engine, 'before_execute')
+def _record_statement(conn, clauseelement, multiparams, params,
+                      execution_options):
+    statements = _statements.get()
+    if statements is not None:
+        statements.append(clauseelement)
 
 
 @contextmanager
@@ -36,13 +91,8 @@ def statement_log(connection: Connection) -> List[Type[Executable]]:
         The current list of statements.
     '''
 
-    statements = []
-
-    def before_execute(conn, clauseelement, multiparams, params):
-        statements.append(clauseelement)
-
-    event.listen(connection, 'before_execute', before_execute)
+    token = _statements.set([])
     try:
-        yield statements
+        yield _statements.get()
     finally:
-        event.remove(connection, "before_execute", before_execute)
+        _statements.reset(token)
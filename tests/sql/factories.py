@@ -106,3 +106,70 @@ class ImageFactory(Factory):
     name = Sequence(lambda n: f'image{n}')
     pyramid_levels = 1
     fileset = SubFactory(FilesetFactory)
+
+
+# Stub factories build plain dicts of the column values an instance would
+# have, for tests which only read the attributes and discard the object.
+# Meta.model is inherited unchanged from the model factory (factory_boy
+# only shares a sequence counter between factories of the same model), so
+# the stubs draw from the same counter and name/uuid uniqueness against
+# rows persisted by the model factories is preserved.
+
+class DictStub:
+    '''Mixin returning the evaluated declarations as a plain dict.
+
+    Listed before the model factory so that its _create wins and no model
+    instance is ever constructed.
+    '''
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        return kwargs
+
+
+class UserStubFactory(DictStub, UserFactory):
+    pass
+
+
+class GroupStubFactory(DictStub, GroupFactory):
+    pass
+
+
+class MembershipStubFactory(DictStub, MembershipFactory):
+
+    class Meta:
+        exclude = ('group', 'user')
+
+    group = None
+    user = None
+    user_uuid = None
+    group_uuid = None
+
+
+class RepositoryStubFactory(DictStub, RepositoryFactory):
+
+    raw_storage = 'Archive'
+
+
+class ImportStubFactory(DictStub, ImportFactory):
+
+    class Meta:
+        exclude = ('repository',)
+
+    repository = None
+
+
+class FilesetStubFactory(DictStub, FilesetFactory):
+
+    class Meta:
+        exclude = ('complete', 'import_')
+
+    import_ = None
+
+
+class ImageStubFactory(DictStub, ImageFactory):
+
+    class Meta:
+        exclude = ('fileset',)
+
+    fileset = None
@@ -1,104 +1,90 @@
-import pytest
 from minerva_db.sql.api.utils import to_jsonapi
-from . import sa_obj_to_dict, statement_log
+from . import (sa_obj_to_dict, statement_log, GRANT_KEYS,
+               REPOSITORY_KEYS)
 
 
-@pytest.mark.parametrize('fixture_name', ['user_granted_read_hierarchy',
-                                          'group_granted_read_hierarchy'])
 class TestGrants():
 
-    def test_repository(self, client, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
-        user_uuid = hierarchy['user'].uuid
-        repository_uuid = hierarchy['repository'].uuid
+    def test_repository(self, client, granted_read_hierarchy):
+        user_uuid = granted_read_hierarchy['user'].uuid
+        repository_uuid = granted_read_hierarchy['repository'].uuid
         decision = client.has_permission(user_uuid, 'Repository',
                                          repository_uuid, 'Read')
         assert True is decision
 
-    def test_repository_insufficent(self, client, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
-        user_uuid = hierarchy['user'].uuid
-        repository_uuid = hierarchy['repository'].uuid
+    def test_repository_insufficent(self, client, granted_read_hierarchy):
+        user_uuid = granted_read_hierarchy['user'].uuid
+        repository_uuid = granted_read_hierarchy['repository'].uuid
         decision = client.has_permission(user_uuid, 'Repository',
                                          repository_uuid, 'Write')
         assert False is decision
 
-    def test_repository_none(self, client, db_user, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
+    def test_repository_none(self, client, db_user, granted_read_hierarchy):
         user_uuid = db_user.uuid
-        repository_uuid = hierarchy['repository'].uuid
+        repository_uuid = granted_read_hierarchy['repository'].uuid
         decision = client.has_permission(user_uuid, 'Repository',
                                          repository_uuid, 'Read')
         assert False is decision
 
-    def test_import(self, client, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
-        user_uuid = hierarchy['user'].uuid
-        import_uuid = hierarchy['import_'].uuid
+    def test_import(self, client, granted_read_hierarchy):
+        user_uuid = granted_read_hierarchy['user'].uuid
+        import_uuid = granted_read_hierarchy['import_'].uuid
         decision = client.has_permission(user_uuid, 'Import', import_uuid,
                                          'Read')
         assert True is decision
 
-    def test_import_insufficent(self, client, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
-        user_uuid = hierarchy['user'].uuid
-        import_uuid = hierarchy['import_'].uuid
+    def test_import_insufficent(self, client, granted_read_hierarchy):
+        user_uuid = granted_read_hierarchy['user'].uuid
+        import_uuid = granted_read_hierarchy['import_'].uuid
         decision = client.has_permission(user_uuid, 'Import', import_uuid,
                                          'Write')
         assert False is decision
 
-    def test_import_none(self, client, db_user, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
+    def test_import_none(self, client, db_user, granted_read_hierarchy):
         user_uuid = db_user.uuid
-        import_uuid = hierarchy['import_'].uuid
+        import_uuid = granted_read_hierarchy['import_'].uuid
         decision = client.has_permission(user_uuid, 'Import', import_uuid,
                                          'Read')
         assert False is decision
 
-    def test_fileset(self, client, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
-        user_uuid = hierarchy['user'].uuid
-        fileset_uuid = hierarchy['fileset'].uuid
+    def test_fileset(self, client, granted_read_hierarchy):
+        user_uuid = granted_read_hierarchy['user'].uuid
+        fileset_uuid = granted_read_hierarchy['fileset'].uuid
         decision = client.has_permission(user_uuid, 'Fileset', fileset_uuid,
                                          'Read')
         assert True is decision
 
-    def test_fileset_insufficent(self, client, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
-        user_uuid = hierarchy['user'].uuid
-        fileset_uuid = hierarchy['fileset'].uuid
+    def test_fileset_insufficent(self, client, granted_read_hierarchy):
+        user_uuid = granted_read_hierarchy['user'].uuid
+        fileset_uuid = granted_read_hierarchy['fileset'].uuid
         decision = client.has_permission(user_uuid, 'Fileset', fileset_uuid,
                                          'Write')
         assert False is decision
 
-    def test_fileset_none(self, client, db_user, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
+    def test_fileset_none(self, client, db_user, granted_read_hierarchy):
         user_uuid = db_user.uuid
-        fileset_uuid = hierarchy['fileset'].uuid
+        fileset_uuid = granted_read_hierarchy['fileset'].uuid
         decision = client.has_permission(user_uuid, 'Fileset', fileset_uuid,
                                          'Read')
         assert False is decision
 
-    def test_image(self, client, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
-        user_uuid = hierarchy['user'].uuid
-        image_uuid = hierarchy['image'].uuid
+    def test_image(self, client, granted_read_hierarchy):
+        user_uuid = granted_read_hierarchy['user'].uuid
+        image_uuid = granted_read_hierarchy['image'].uuid
         decision = client.has_permission(user_uuid, 'Image', image_uuid,
                                          'Read')
         assert True is decision
 
-    def test_image_insufficent(self, client, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
-        user_uuid = hierarchy['user'].uuid
-        image_uuid = hierarchy['image'].uuid
+    def test_image_insufficent(self, client, granted_read_hierarchy):
+        user_uuid = granted_read_hierarchy['user'].uuid
+        image_uuid = granted_read_hierarchy['image'].uuid
         decision = client.has_permission(user_uuid, 'Image', image_uuid,
                                          'Write')
         assert False is decision
 
-    def test_image_none(self, client, db_user, fixture_name, request):
-        hierarchy = request.getfuncargvalue(fixture_name)
+    def test_image_none(self, client, db_user, granted_read_hierarchy):
         user_uuid = db_user.uuid
-        image_uuid = hierarchy['image'].uuid
+        image_uuid = granted_read_hierarchy['image'].uuid
         decision = client.has_permission(user_uuid, 'Image', image_uuid,
                                          'Read')
         assert False is decision
@@ -108,8 +94,8 @@ class TestLists():
 
     def test_list_repositories_for_user(self, client,
                                         user_granted_read_hierarchy):
-        grant_keys = ['subject_uuid', 'repository_uuid', 'permission']
-        repository_keys = ['uuid', 'name', 'raw_storage']
+        grant_keys = GRANT_KEYS
+        repository_keys = REPOSITORY_KEYS
         user_uuid = user_granted_read_hierarchy['user_uuid']
         d_grant = sa_obj_to_dict(
             user_granted_read_hierarchy['grant'],
@@ -126,20 +112,17 @@ class TestLists():
             }
         ) == client.list_repositories_for_user(user_uuid)
 
-    @pytest.mark.parametrize('fixture_name', ['user_granted_read_hierarchy',
-                                              'group_granted_read_hierarchy'])
-    def test_list_repositories_for_user_implied(self, client, fixture_name,
-                                                request):
-        hierarchy = request.getfuncargvalue(fixture_name)
-        grant_keys = ['subject_uuid', 'repository_uuid', 'permission']
-        repository_keys = ['uuid', 'name', 'raw_storage']
-        user_uuid = hierarchy['user_uuid']
+    def test_list_repositories_for_user_implied(self, client,
+                                                granted_read_hierarchy):
+        grant_keys = GRANT_KEYS
+        repository_keys = REPOSITORY_KEYS
+        user_uuid = granted_read_hierarchy['user_uuid']
         d_grant = sa_obj_to_dict(
-            hierarchy['grant'],
+            granted_read_hierarchy['grant'],
             grant_keys
         )
         d_repository = sa_obj_to_dict(
-            hierarchy['repository'],
+            granted_read_hierarchy['repository'],
             repository_keys
         )
 
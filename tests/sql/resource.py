@@ -5,50 +5,53 @@ from minerva_db.sql.api import DBError
 from minerva_db.sql.api.utils import to_jsonapi
 from minerva_db.sql.models import (Repository, Import, Fileset, Image, Key,
                                    User, Grant)
-from .factories import (RepositoryFactory, ImportFactory, FilesetFactory,
-                        ImageFactory, KeyFactory)
-from . import sa_obj_to_dict, statement_log
+from .factories import (ImportFactory, KeyFactory, RepositoryStubFactory,
+                        ImportStubFactory, FilesetStubFactory,
+                        ImageStubFactory)
+from . import (sa_obj_to_dict, statement_log, REPOSITORY_KEYS,
+               IMPORT_KEYS, FILESET_KEYS, IMAGE_KEYS, KEY_KEYS)
 
 
 class TestRepository():
 
     def test_create_repository(self, client, session, db_user):
-        keys = ('uuid', 'name', 'raw_storage')
-        d = sa_obj_to_dict(RepositoryFactory(), keys)
+        keys = REPOSITORY_KEYS
+        d = RepositoryStubFactory()
         assert to_jsonapi(d) == client.create_repository(
             user_uuid=db_user.uuid,
             **d
         )
-        repository = session.query(Repository).one()
+        repository = (
+            session.query(Repository)
+            .filter(Repository.uuid == d['uuid'])
+            .one()
+        )
         assert d == sa_obj_to_dict(repository, keys)
-        assert db_user == repository.subjects[0]
+        assert db_user.uuid == repository.subjects[0].uuid
 
     @pytest.mark.parametrize('duplicate_key', ['uuid', 'name'])
     def test_create_repository_duplicate(self, client, db_user, duplicate_key):
-        keys = ('uuid', 'name', 'raw_storage')
-        d1 = sa_obj_to_dict(RepositoryFactory(), keys)
-        d2 = sa_obj_to_dict(RepositoryFactory(), keys)
+        d1 = RepositoryStubFactory()
+        d2 = RepositoryStubFactory()
         d2[duplicate_key] = d1[duplicate_key]
         client.create_repository(user_uuid=db_user.uuid, **d1)
         with pytest.raises(IntegrityError):
             client.create_repository(user_uuid=db_user.uuid, **d2)
 
     def test_create_repository_nonexistant_user(self, client, session):
-        keys = ('uuid', 'name', 'raw_storage')
-        d = sa_obj_to_dict(RepositoryFactory(), keys)
+        d = RepositoryStubFactory()
         with pytest.raises(NoResultFound):
             client.create_repository(user_uuid='nonexistant', **d)
 
     def test_create_repository_nonexistant_raw_storage(self, client, db_user,
                                                        session):
-        keys = ('uuid', 'name', 'raw_storage')
-        d = sa_obj_to_dict(RepositoryFactory(), keys)
+        d = RepositoryStubFactory()
         d['raw_storage'] = 'nonexistant'
         with pytest.raises(DataError):
             client.create_repository(user_uuid=db_user.uuid, **d)
 
     def test_get_repository(self, client, db_repository):
-        keys = ('uuid', 'name', 'raw_storage')
+        keys = REPOSITORY_KEYS
         d = sa_obj_to_dict(db_repository, keys)
         assert to_jsonapi(d) == client.get_repository(db_repository.uuid)
 
@@ -56,15 +59,8 @@ class TestRepository():
         with pytest.raises(NoResultFound):
             client.get_repository('nonexistant')
 
-    def test_get_repository_query_count(self, connection, client,
-                                        db_repository):
-        repository_uuid = db_repository.uuid
-        with statement_log(connection) as statements:
-            client.get_repository(repository_uuid)
-            assert len(statements) == 1
-
     def test_update_repository_name(self, client, db_repository):
-        keys = ('uuid', 'name', 'raw_storage')
+        keys = REPOSITORY_KEYS
         d = sa_obj_to_dict(db_repository, keys)
         repository = client.update_repository(db_repository.uuid,
                                               name='renamed')
@@ -72,7 +68,7 @@ class TestRepository():
         assert to_jsonapi(d) == repository
 
     def test_update_repository_raw_storage(self, client, db_repository):
-        keys = ('uuid', 'name', 'raw_storage')
+        keys = REPOSITORY_KEYS
         d = sa_obj_to_dict(db_repository, keys)
         repository = client.update_repository(db_repository.uuid,
                                               raw_storage='Destroy')
@@ -81,58 +77,89 @@ class TestRepository():
 
     def test_delete_repository(self, client, session, db_repository):
         client.delete_repository(db_repository.uuid)
-        assert 0 == session.query(Repository).count()
+        assert 0 == (
+            session.query(Repository)
+            .filter(Repository.uuid == db_repository.uuid)
+            .count()
+        )
 
     def test_delete_repository_with_contents(self, client, session,
                                              user_granted_read_hierarchy):
-        db_repository = user_granted_read_hierarchy['repository']
-        client.delete_repository(db_repository.uuid)
-        assert 0 == session.query(Repository).count()
-        assert 0 == session.query(Import).count()
-        assert 0 == session.query(Fileset).count()
-        assert 0 == session.query(Image).count()
-        assert 0 == session.query(Key).count()
-        assert 0 == session.query(Grant).count()
-        assert 1 == session.query(User).count()
+        hierarchy = user_granted_read_hierarchy
+        client.delete_repository(hierarchy['repository_uuid'])
+
+        # Assert the remains of the whole hierarchy in a single round-trip
+        (repository_exists, import_exists, fileset_exists, image_exists,
+         key_exists, grant_exists, user_exists) = session.query(
+            session.query(Repository)
+            .filter(Repository.uuid == hierarchy['repository_uuid'])
+            .exists(),
+            session.query(Import)
+            .filter(Import.uuid == hierarchy['import_uuid'])
+            .exists(),
+            session.query(Fileset)
+            .filter(Fileset.uuid == hierarchy['fileset_uuid'])
+            .exists(),
+            session.query(Image)
+            .filter(Image.uuid == hierarchy['image_uuid'])
+            .exists(),
+            session.query(Key)
+            .filter(Key.import_uuid == hierarchy['import_uuid'])
+            .exists(),
+            session.query(Grant)
+            .filter(Grant.repository_uuid == hierarchy['repository_uuid'])
+            .exists(),
+            session.query(User)
+            .filter(User.uuid == hierarchy['user_uuid'])
+            .exists()
+        ).one()
+        assert False is repository_exists
+        assert False is import_exists
+        assert False is fileset_exists
+        assert False is image_exists
+        assert False is key_exists
+        assert False is grant_exists
+        assert True is user_exists
 
 
 class TestImport():
 
     def test_create_import(self, client, session, db_repository):
         keys = ('uuid', 'name')
-        import_ = ImportFactory()
-        create_d = sa_obj_to_dict(import_, keys)
+        create_d = ImportStubFactory()
         keys += ('complete',)
-        d = sa_obj_to_dict(import_, keys)
+        d = dict(create_d, complete=False)
         d['repository_uuid'] = db_repository.uuid
         assert to_jsonapi(d) == client.create_import(
             repository_uuid=db_repository.uuid,
             **create_d
         )
-        import_ = session.query(Import).one()
+        import_ = (
+            session.query(Import)
+            .filter(Import.uuid == d['uuid'])
+            .one()
+        )
         keys += ('repository_uuid',)
         assert d == sa_obj_to_dict(import_, keys)
-        assert db_repository == import_.repository
+        assert db_repository.uuid == import_.repository.uuid
 
     @pytest.mark.parametrize('duplicate_key', ['uuid', 'name'])
     def test_create_import_duplicate(self, client, db_repository,
                                      duplicate_key):
-        keys = ('uuid', 'name')
-        d1 = sa_obj_to_dict(ImportFactory(), keys)
-        d2 = sa_obj_to_dict(ImportFactory(), keys)
+        d1 = ImportStubFactory()
+        d2 = ImportStubFactory()
         d2[duplicate_key] = d1[duplicate_key]
         client.create_import(repository_uuid=db_repository.uuid, **d1)
         with pytest.raises(IntegrityError):
             client.create_import(repository_uuid=db_repository.uuid, **d2)
 
     def test_create_import_nonexistant_repository(self, client, session):
-        keys = ('uuid', 'name')
-        d = sa_obj_to_dict(ImportFactory(), keys)
+        d = ImportStubFactory()
         with pytest.raises(NoResultFound):
             client.create_import(repository_uuid='nonexistant', **d)
 
     def test_get_import(self, client, db_import):
-        keys = ('uuid', 'name', 'complete', 'repository_uuid')
+        keys = IMPORT_KEYS
         d = sa_obj_to_dict(db_import, keys)
         assert to_jsonapi(d) == client.get_import(db_import.uuid)
 
@@ -140,46 +167,25 @@ class TestImport():
         with pytest.raises(NoResultFound):
             client.get_import('nonexistant')
 
-    def test_get_import_query_count(self, connection, client, db_import):
-        import_uuid = db_import.uuid
-        with statement_log(connection) as statements:
-            client.get_import(import_uuid)
-            assert len(statements) == 1
-
     def test_list_imports_in_repository(self, client,
                                         user_granted_read_hierarchy):
-        keys = ('uuid', 'name', 'complete', 'repository_uuid')
+        keys = IMPORT_KEYS
         d = sa_obj_to_dict(user_granted_read_hierarchy['import_'], keys)
         assert to_jsonapi([d]) == client.list_imports_in_repository(
             user_granted_read_hierarchy['repository_uuid']
         )
 
-    def test_list_imports_in_repository_query_count(
-        self, connection, client, user_granted_read_hierarchy
-    ):
-        repository_uuid = user_granted_read_hierarchy['repository_uuid']
-        with statement_log(connection) as statements:
-            client.list_imports_in_repository(repository_uuid)
-            assert len(statements) == 1
-
     # TODO Test class for Key?
     def test_list_keys_in_import(self, client,
                                  user_granted_read_hierarchy):
-        keys = ('key', 'import_uuid', 'fileset_uuid')
+        keys = KEY_KEYS
         d = sa_obj_to_dict(user_granted_read_hierarchy['key'], keys)
         assert to_jsonapi([d]) == client.list_keys_in_import(
             user_granted_read_hierarchy['import_uuid']
         )
 
-    def test_list_keys_in_import_query_count(self, connection, client,
-                                             user_granted_read_hierarchy):
-        import_uuid = user_granted_read_hierarchy['import_uuid']
-        with statement_log(connection) as statements:
-            client.list_keys_in_import(import_uuid)
-            assert len(statements) == 1
-
     def test_update_import_name(self, client, db_import):
-        keys = ('uuid', 'name', 'complete', 'repository_uuid')
+        keys = IMPORT_KEYS
         d = sa_obj_to_dict(db_import, keys)
         import_ = client.update_import(db_import.uuid,
                                        name='renamed')
@@ -187,7 +193,7 @@ class TestImport():
         assert to_jsonapi(d) == import_
 
     def test_update_import_complete(self, client, db_import):
-        keys = ('uuid', 'name', 'complete', 'repository_uuid')
+        keys = IMPORT_KEYS
         d = sa_obj_to_dict(db_import, keys)
         import_ = client.update_import(db_import.uuid,
                                        complete=True)
@@ -200,17 +206,20 @@ class TestFileset():
     def test_create_fileset(self, client, session, db_import_with_keys):
         db_keys = [key.key for key in db_import_with_keys.keys[:2]]
         keys = ('uuid', 'name', 'reader', 'reader_software', 'reader_version')
-        fileset = FilesetFactory()
-        create_d = sa_obj_to_dict(fileset, keys)
+        create_d = FilesetStubFactory()
         keys += ('complete',)
-        d = sa_obj_to_dict(fileset, keys)
+        d = dict(create_d, complete=False)
         d['import_uuid'] = db_import_with_keys.uuid
         assert to_jsonapi(d) == client.create_fileset(
             import_uuid=db_import_with_keys.uuid,
             keys=db_keys,
             **create_d
         )
-        fileset = session.query(Fileset).one()
+        fileset = (
+            session.query(Fileset)
+            .filter(Fileset.uuid == d['uuid'])
+            .one()
+        )
         keys += ('import_uuid',)
         assert d == sa_obj_to_dict(fileset, keys)
         assert db_import_with_keys == fileset.import_
@@ -218,9 +227,8 @@ class TestFileset():
 
     @pytest.mark.parametrize('duplicate_key', ['uuid'])
     def test_create_fileset_duplicate(self, client, db_import, duplicate_key):
-        keys = ('uuid', 'name', 'reader', 'reader_software', 'reader_version')
-        d1 = sa_obj_to_dict(FilesetFactory(), keys)
-        d2 = sa_obj_to_dict(FilesetFactory(), keys)
+        d1 = FilesetStubFactory()
+        d2 = FilesetStubFactory()
         d2[duplicate_key] = d1[duplicate_key]
         client.create_fileset(import_uuid=db_import.uuid, keys=[], **d1)
         with pytest.raises(IntegrityError):
@@ -228,9 +236,8 @@ class TestFileset():
 
     def test_create_fileset_duplicate_key(self, client, db_import_with_keys):
         db_keys = [db_import_with_keys.keys[0].key]
-        keys = ('uuid', 'name', 'reader', 'reader_software', 'reader_version')
-        d1 = sa_obj_to_dict(FilesetFactory(), keys)
-        d2 = sa_obj_to_dict(FilesetFactory(), keys)
+        d1 = FilesetStubFactory()
+        d2 = FilesetStubFactory()
         client.create_fileset(import_uuid=db_import_with_keys.uuid,
                               keys=db_keys, **d1)
         with pytest.raises(DBError):
@@ -238,15 +245,13 @@ class TestFileset():
                                   keys=db_keys, **d2)
 
     def test_create_fileset_nonexistant_import(self, client, session):
-        keys = ('uuid', 'name', 'reader', 'reader_software', 'reader_version')
-        d = sa_obj_to_dict(FilesetFactory(), keys)
+        d = FilesetStubFactory()
         with pytest.raises(NoResultFound):
             client.create_fileset(import_uuid='nonexistant', keys=[], **d)
 
     def test_create_fileset_with_duplicate_key_in_different_imports(self,
                                                                     client,
                                                                     session):
-        keys = ('uuid', 'name', 'reader', 'reader_software', 'reader_version')
         import1 = ImportFactory()
         import2 = ImportFactory()
         key1 = KeyFactory(import_=import1, key='key')
@@ -254,16 +259,13 @@ class TestFileset():
         session.add_all([import1, import2, key1, key2])
         session.commit()
 
-        fileset1 = FilesetFactory()
-        fileset2 = FilesetFactory()
-        d1 = sa_obj_to_dict(fileset1, keys)
-        d2 = sa_obj_to_dict(fileset2, keys)
+        d1 = FilesetStubFactory()
+        d2 = FilesetStubFactory()
         client.create_fileset(import_uuid=import1.uuid, keys=['key'], **d1)
         client.create_fileset(import_uuid=import2.uuid, keys=['key'], **d2)
 
     def test_get_fileset(self, client, db_fileset):
-        keys = ('uuid', 'name', 'reader', 'reader_software', 'reader_version',
-                'complete', 'import_uuid')
+        keys = FILESET_KEYS
         d = sa_obj_to_dict(db_fileset, keys)
         assert to_jsonapi(d) == client.get_fileset(db_fileset.uuid)
 
@@ -271,58 +273,34 @@ class TestFileset():
         with pytest.raises(NoResultFound):
             client.get_fileset('nonexistant')
 
-    def test_get_fileset_query_count(self, connection, client, db_fileset):
-        fileset_uuid = db_fileset.uuid
-        with statement_log(connection) as statements:
-            client.get_fileset(fileset_uuid)
-            assert len(statements) == 1
-
     def test_list_filesets_in_import(self, client,
                                      user_granted_read_hierarchy):
-        keys = ('uuid', 'name', 'reader', 'reader_software', 'reader_version',
-                'complete', 'import_uuid')
+        keys = FILESET_KEYS
         d = sa_obj_to_dict(user_granted_read_hierarchy['fileset'], keys)
         assert to_jsonapi([d]) == client.list_filesets_in_import(
             user_granted_read_hierarchy['import_uuid']
         )
 
-    def test_list_filesets_in_import_query_count(self, connection, client,
-                                                 user_granted_read_hierarchy):
-        import_uuid = user_granted_read_hierarchy['import_uuid']
-        with statement_log(connection) as statements:
-            client.list_filesets_in_import(import_uuid)
-            assert len(statements) == 1
-
     # TODO Test class for Key?
     def test_list_keys_in_fileset(self, client,
                                   user_granted_read_hierarchy):
-        keys = ('key', 'import_uuid', 'fileset_uuid')
+        keys = KEY_KEYS
         d = sa_obj_to_dict(user_granted_read_hierarchy['key'], keys)
         assert to_jsonapi([d]) == client.list_keys_in_fileset(
             user_granted_read_hierarchy['fileset_uuid']
         )
 
-    def test_list_keys_in_fileset_query_count(self, connection, client,
-                                              user_granted_read_hierarchy):
-        fileset_uuid = user_granted_read_hierarchy['fileset_uuid']
-        with statement_log(connection) as statements:
-            client.list_keys_in_fileset(fileset_uuid)
-            assert len(statements) == 1
-
     def test_update_fileset_complete(self, client, db_fileset):
-        keys = ('uuid', 'name', 'reader', 'reader_software', 'reader_version',
-                'complete', 'import_uuid')
+        keys = FILESET_KEYS
         d = sa_obj_to_dict(db_fileset, keys)
         d['complete'] = True
         assert to_jsonapi(d) == client.update_fileset(db_fileset.uuid,
                                                       complete=True)
 
     def test_update_fileset_complete_with_images(self, client, db_fileset):
-        keys = ('uuid', 'name', 'reader', 'reader_software', 'reader_version',
-                'complete', 'import_uuid')
+        keys = FILESET_KEYS
         d = sa_obj_to_dict(db_fileset, keys)
-        d_image = sa_obj_to_dict(ImageFactory(), ['uuid', 'name',
-                                                  'pyramid_levels'])
+        d_image = ImageStubFactory()
         d['complete'] = True
         assert to_jsonapi(d) == client.update_fileset(db_fileset.uuid,
                                                       complete=True,
@@ -332,8 +310,7 @@ class TestFileset():
         assert to_jsonapi([d_image]) == image
 
     def test_update_fileset_incomplete_with_images(self, client, db_fileset):
-        d_image = sa_obj_to_dict(ImageFactory(), ['uuid', 'name',
-                                                  'pyramid_levels'])
+        d_image = ImageStubFactory()
         with pytest.raises(DBError):
             client.update_fileset(db_fileset.uuid, images=[d_image])
 
@@ -342,37 +319,38 @@ class TestImage():
 
     def test_create_image(self, client, session, db_fileset):
         keys = ('uuid', 'name', 'pyramid_levels')
-        image = ImageFactory()
-        create_d = sa_obj_to_dict(image, keys)
-        d = sa_obj_to_dict(image, keys)
+        create_d = ImageStubFactory()
+        d = dict(create_d)
         d['fileset_uuid'] = db_fileset.uuid
         assert to_jsonapi(d) == client.create_image(
             fileset_uuid=db_fileset.uuid,
             **create_d
         )
-        image = session.query(Image).one()
+        image = (
+            session.query(Image)
+            .filter(Image.uuid == d['uuid'])
+            .one()
+        )
         keys += ('fileset_uuid',)
         assert d == sa_obj_to_dict(image, keys)
-        assert db_fileset == image.fileset
+        assert db_fileset.uuid == image.fileset.uuid
 
     @pytest.mark.parametrize('duplicate_key', ['uuid'])
     def test_create_image_duplicate(self, client, db_fileset, duplicate_key):
-        keys = ('uuid', 'name', 'pyramid_levels')
-        d1 = sa_obj_to_dict(ImageFactory(), keys)
-        d2 = sa_obj_to_dict(ImageFactory(), keys)
+        d1 = ImageStubFactory()
+        d2 = ImageStubFactory()
         d2[duplicate_key] = d1[duplicate_key]
         client.create_image(fileset_uuid=db_fileset.uuid, **d1)
         with pytest.raises(IntegrityError):
             client.create_image(fileset_uuid=db_fileset.uuid, **d2)
 
     def test_create_image_nonexistant_repository(self, client, session):
-        keys = ('uuid', 'name', 'pyramid_levels')
-        d = sa_obj_to_dict(ImageFactory(), keys)
+        d = ImageStubFactory()
         with pytest.raises(NoResultFound):
             client.create_image(fileset_uuid='nonexistant', **d)
 
     def test_get_image(self, client, db_image):
-        keys = ('uuid', 'name', 'pyramid_levels', 'fileset_uuid')
+        keys = IMAGE_KEYS
         d = sa_obj_to_dict(db_image, keys)
         assert to_jsonapi(d) == client.get_image(db_image.uuid)
 
@@ -380,23 +358,45 @@ class TestImage():
         with pytest.raises(NoResultFound):
             client.get_image('nonexistant')
 
-    def test_get_image_query_count(self, connection, client, db_image):
-        image_uuid = db_image.uuid
-        with statement_log(connection) as statements:
-            client.get_image(image_uuid)
-            assert len(statements) == 1
-
     def test_list_images_in_fileset(self, client,
                                     user_granted_read_hierarchy):
-        keys = ('uuid', 'name', 'pyramid_levels', 'fileset_uuid')
+        keys = IMAGE_KEYS
         d = sa_obj_to_dict(user_granted_read_hierarchy['image'], keys)
         assert to_jsonapi([d]) == client.list_images_in_fileset(
             user_granted_read_hierarchy['fileset_uuid']
         )
 
-    def test_list_images_in_fileset_query_count(self, connection, client,
-                                                user_granted_read_hierarchy):
-        fileset_uuid = user_granted_read_hierarchy['fileset_uuid']
+
+class TestQueryCounts():
+
+    @pytest.mark.parametrize('getter,fixture_name', [
+        ('get_repository', 'db_repository'),
+        ('get_import', 'db_import'),
+        ('get_fileset', 'db_fileset'),
+        ('get_image', 'db_image')
+    ])
+    def test_get_query_count(self, connection, client, request, getter,
+                             fixture_name, db_repository, db_import,
+                             db_fileset, db_image):
+        # The db_* fixtures are requested statically so their rows are
+        # created before the per-test SAVEPOINT even when tests are
+        # selected individually; getfixturevalue then returns the cached
+        # instance for the parametrized case
+        uuid = request.getfixturevalue(fixture_name).uuid
+        with statement_log(connection) as statements:
+            getattr(client, getter)(uuid)
+            assert len(statements) == 1
+
+    @pytest.mark.parametrize('lister,uuid_key', [
+        ('list_imports_in_repository', 'repository_uuid'),
+        ('list_keys_in_import', 'import_uuid'),
+        ('list_filesets_in_import', 'import_uuid'),
+        ('list_keys_in_fileset', 'fileset_uuid'),
+        ('list_images_in_fileset', 'fileset_uuid')
+    ])
+    def test_list_query_count(self, connection, client,
+                              user_granted_read_hierarchy, lister, uuid_key):
+        uuid = user_granted_read_hierarchy[uuid_key]
         with statement_log(connection) as statements:
-            client.list_images_in_fileset(fileset_uuid)
+            getattr(client, lister)(uuid)
             assert len(statements) == 1
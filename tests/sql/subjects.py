@@ -3,23 +3,24 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.exc import NoResultFound
 from minerva_db.sql.models import User, Group, Membership
 from minerva_db.sql.api.utils import to_jsonapi
-from .factories import GroupFactory, UserFactory, MembershipFactory
-from . import sa_obj_to_dict, statement_log
+from .factories import (GroupStubFactory, UserStubFactory,
+                        MembershipStubFactory)
+from . import (sa_obj_to_dict, statement_log, fetch_cols, USER_KEYS,
+               GROUP_KEYS, MEMBERSHIP_KEYS)
 
 
 class TestUser():
 
     def test_create_user(self, client, session):
-        keys = ('uuid',)
-        d = sa_obj_to_dict(UserFactory(), keys)
+        keys = USER_KEYS
+        d = UserStubFactory()
         assert to_jsonapi(d) == client.create_user(**d)
-        assert d == sa_obj_to_dict(session.query(User).one(), keys)
+        assert d == fetch_cols(session, User, keys, uuid=d['uuid'])
 
     @pytest.mark.parametrize('duplicate_key', ['uuid'])
     def test_create_user_duplicate(self, client, duplicate_key):
-        keys = ('uuid',)
-        d1 = sa_obj_to_dict(UserFactory(), keys)
-        d2 = sa_obj_to_dict(UserFactory(), keys)
+        d1 = UserStubFactory()
+        d2 = UserStubFactory()
         d2[duplicate_key] = d1[duplicate_key]
         print(d1)
         client.create_user(**d1)
@@ -27,7 +28,7 @@ class TestUser():
             client.create_user(**d2)
 
     def test_get_user(self, client, db_user):
-        keys = ('uuid',)
+        keys = USER_KEYS
         d = sa_obj_to_dict(db_user, keys)
         assert to_jsonapi(d) == client.get_user(db_user.uuid)
 
@@ -45,30 +46,31 @@ class TestUser():
 class TestGroup():
 
     def test_create_group(self, client, session, db_user):
-        keys = ('uuid', 'name')
-        d = sa_obj_to_dict(GroupFactory(), keys)
+        keys = GROUP_KEYS
+        d = GroupStubFactory()
         assert to_jsonapi(d) == client.create_group(user_uuid=db_user.uuid,
                                                     **d)
-        assert d == sa_obj_to_dict(session.query(Group).one(), keys)
+        assert d == fetch_cols(session, Group, keys, uuid=d['uuid'])
 
     def test_create_group_owner(self, client, session, db_user):
-        keys = ('uuid', 'name')
-        d = sa_obj_to_dict(GroupFactory(), keys)
+        d = GroupStubFactory()
         client.create_group(user_uuid=db_user.uuid, **d)
-        assert session.query(Membership).one().membership_type == 'Owner'
+        assert {'membership_type': 'Owner'} == fetch_cols(
+            session, Membership, ('membership_type',),
+            group_uuid=d['uuid']
+        )
 
     @pytest.mark.parametrize('duplicate_key', ['uuid', 'name'])
     def test_create_group_duplicate(self, client, db_user, duplicate_key):
-        keys = ('uuid', 'name')
-        d1 = sa_obj_to_dict(GroupFactory(), keys)
-        d2 = sa_obj_to_dict(GroupFactory(), keys)
+        d1 = GroupStubFactory()
+        d2 = GroupStubFactory()
         d2[duplicate_key] = d1[duplicate_key]
         client.create_group(user_uuid=db_user.uuid, **d1)
         with pytest.raises(IntegrityError):
             client.create_group(user_uuid=db_user.uuid, **d2)
 
     def test_get_group(self, client, db_group):
-        keys = ('uuid', 'name')
+        keys = GROUP_KEYS
         d = sa_obj_to_dict(db_group, keys)
         assert to_jsonapi(d) == client.get_group(db_group.uuid)
 
@@ -86,13 +88,15 @@ class TestGroup():
 class TestMembership():
 
     def test_create_membership(self, client, session, db_user, db_group):
-        keys = ['user_uuid', 'group_uuid', 'membership_type']
-        d = sa_obj_to_dict(MembershipFactory(), keys)
+        keys = MEMBERSHIP_KEYS
+        d = MembershipStubFactory()
         d['user_uuid'] = db_user.uuid
         d['group_uuid'] = db_group.uuid
         m = client.create_membership(db_group.uuid, db_user.uuid, 'Member')
         assert to_jsonapi(d) == m
-        assert d == sa_obj_to_dict(session.query(Membership).one(), keys)
+        assert d == fetch_cols(session, Membership, keys,
+                               group_uuid=db_group.uuid,
+                               user_uuid=db_user.uuid)
 
     def test_create_membership_duplicate(self, client, session, db_user,
                                          db_group):
@@ -111,9 +115,9 @@ class TestMembership():
             client.create_membership(db_group.uuid, 'nonexistant', 'Member')
 
     def test_get_membership(self, client, db_membership):
-        membership_keys = ('user_uuid', 'group_uuid', 'membership_type')
-        group_keys = ('uuid', 'name')
-        user_keys = ('uuid',)
+        membership_keys = MEMBERSHIP_KEYS
+        group_keys = GROUP_KEYS
+        user_keys = USER_KEYS
         d_membership = sa_obj_to_dict(db_membership, membership_keys)
         d_group = sa_obj_to_dict(db_membership.group, group_keys)
         d_user = sa_obj_to_dict(db_membership.user, user_keys)
@@ -139,13 +143,12 @@ class TestMembership():
             assert len(statements) == 1
 
     def test_update_membership(self, client, session, db_user, db_group):
-        keys = ['user_uuid', 'group_uuid', 'membership_type']
-        db_membership = MembershipFactory(group=db_group, user=db_user,
-                                          membership_type='Member')
-        session.add(db_membership)
-        session.commit()
-        d = sa_obj_to_dict(db_membership, keys)
-        d['membership_type'] = 'Owner'
+        client.create_membership(db_group.uuid, db_user.uuid, 'Member')
+        d = {
+            'user_uuid': db_user.uuid,
+            'group_uuid': db_group.uuid,
+            'membership_type': 'Owner'
+        }
         assert to_jsonapi(d)['data'] == client.update_membership(
             db_group.uuid,
             db_user.uuid,
@@ -157,9 +160,22 @@ class TestMembership():
         db_membership = group_granted_read_hierarchy['membership']
         client.delete_membership(db_membership.group_uuid,
                                  db_membership.user_uuid)
-        assert 0 == session.query(Membership).count()
-        assert 1 == session.query(User).count()
-        assert 1 == session.query(Group).count()
+        # Assert the remains of the membership in a single round-trip
+        membership_exists, user_exists, group_exists = session.query(
+            session.query(Membership)
+            .filter(Membership.group_uuid == db_membership.group_uuid)
+            .filter(Membership.user_uuid == db_membership.user_uuid)
+            .exists(),
+            session.query(User)
+            .filter(User.uuid == db_membership.user_uuid)
+            .exists(),
+            session.query(Group)
+            .filter(Group.uuid == db_membership.group_uuid)
+            .exists()
+        ).one()
+        assert False is membership_exists
+        assert True is user_exists
+        assert True is group_exists
 
     # TODO Add user to group when already a member
     # TODO Remove user from group when not a member